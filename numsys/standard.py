@@ -2,9 +2,6 @@
 try: import support as _sup
 except ImportError: from numsys import support as _sup
 
-log, floor, ceil = _sup.log, _sup.floor, _sup.ceil
-mpc, mpf = _sup.mpc, _sup.mpf
-
 
 def to_zb(num, base, **kwargs):  # to integer base (Z)
     """
@@ -20,6 +17,9 @@ def to_zb(num, base, **kwargs):  # to integer base (Z)
     num, lst, base = int(num), [], int(base)
     if num < 0 and base > 0: num *= -1; lst = [sgn]  # negatives in +bases
 
+    if abs(num).bit_length() > _dc_bits:  # split huge values in halves
+        return _zb_split(num, base) + lst  # sign goes last, as below
+
     while num:
         num, d = divmod(num, base)
         if d < 0: num += 1; d -= base   # values in -bases
@@ -27,6 +27,63 @@ def to_zb(num, base, **kwargs):  # to integer base (Z)
     lst.reverse()
     return lst
 
+# divide and conquer integer conversion ----------------------------------
+# a number of 2**k digits is split into two numbers of 2**(k-1) digits by
+# (almost) a single divmod with base ** 2**(k-1) - the powers are kept per
+# base, so converting similar sized values again does not recompute them
+_dc_bits = 1 << 11  # values larger than this (in bits) are split
+_dc_leaf = 6        # halves of up to 2**_dc_leaf digits are done directly
+_pow_tree = {}      # {base: [base, base**2, base**4, ..., base**(2**k)]}
+
+def _pow2k(base, k):
+    "returns base ** (2 ** k), squaring up from cached powers as needed"
+    pows = _pow_tree.get(base)
+    if pows is None:
+        if len(_pow_tree) >= 64: _pow_tree.clear()  # keep it bounded
+        pows = _pow_tree[base] = [base]
+    while len(pows) <= k: pows.append(pows[-1] * pows[-1])
+    return pows[k]
+
+def _zb_fits(num, base, k):
+    "True if num can be written in 2**k digits of base"
+    B = _pow2k(base, k)
+    if base > 0: return 0 <= num < B
+    b = -base  # range of an even number of digits in a -base
+    return -((B - 1) // (b + 1) * b) <= num <= (B - 1) // (b + 1)
+
+def _zb_split(num, base):
+    "to_zb for large values - returns the digits of num (no sign)"
+    b = abs(base)  # start from a size estimate, then make sure it fits
+    k = max(_dc_leaf + 1, (num.bit_length() // b.bit_length() + 1).bit_length())
+    while not _zb_fits(num, base, k): k += 1
+
+    lst = []
+    _zb_half(num, base, k, lst)
+    for i, d in enumerate(lst):  # remove leading zeros
+        if d: return lst[i:]
+    return [0]
+
+def _zb_half(num, base, k, lst):
+    "appends exactly 2**k digits of num to lst"
+    if k <= _dc_leaf:
+        dgt = []
+        while num:
+            num, d = divmod(num, base)
+            if d < 0: num += 1; d -= base   # values in -bases
+            dgt.append(d)
+        lst.extend([0] * ((1 << k) - len(dgt)))
+        lst.extend(reversed(dgt))
+        return
+
+    B = _pow2k(base, k - 1)  # even power, so also positive for -bases
+    if base > 0: hi, lo = divmod(num, B)
+    else:  # lower half must be in the range of 2**(k-1) -base digits
+        off = (B - 1) // (1 - base) * -base
+        lo = (num + off) % B - off
+        hi = (num - lo) // B
+    _zb_half(hi, base, k - 1, lst)
+    _zb_half(lo, base, k - 1, lst)
+
 def to_pb(num, base, **kwargs):  # to Positive base
     """
     converts a real in base 10 to base (real and > 1)
@@ -41,25 +98,25 @@ def to_pb(num, base, **kwargs):  # to Positive base
     if base <= 1:
         raise E
 
-    num, base = mpf(num), mpf(base) # to insure precision
+    num, base = _sup.mpf(num), _sup.mpf(base) # to insure precision
     if num < 0: lst = [sgn]; num = -num  # handle negative values
     else: lst = []
 
-    P = ceil(log(abs(num), base)); X = num / base ** P  # setup stuff
+    P = _sup.ceil(_sup.log(abs(num), base)); X = num / base ** P  # setup stuff
     #while not 0 <= X < 1: P += 1; X = num / base ** P  # log should cover this
-    def T(x): return base * x - floor(base * x)  # transformation function
+    def T(x): return base * x - _sup.floor(base * x)  # transformation function
 
     if P <= 0:  # if starting with a fractional value
         lst.extend([0, sep])
         lst.extend(([0] * -int(P)))
 
     prc = _sup.prec
-    prc = int(prc * log(2, base))  # insure precision is in new base
+    prc = int(prc * _sup.log(2, base))  # insure precision is in new base
     prc = P - prc  # go only as far as precision is good
     if prc >= 0: prc = -1  # but in this event, go as far as B^-1
 
     while P > prc:  # conversion step
-        d = int(floor(X * base))  # get digit
+        d = int(_sup.floor(X * base))  # get digit
         X = T(X)
         if P == 0 and sep not in lst:  # don't add it if its already there!
             lst.append(sep)
@@ -82,27 +139,27 @@ def to_nb(num, base, **kwargs):  # to Negative base
     if base >= -1:
         raise E
 
-    num, base, one = mpf(num), abs(mpf(base)), mpf(1)
+    num, base, one = _sup.mpf(num), abs(_sup.mpf(base)), _sup.mpf(1)
     # ref. defines method for -base where base > 0
 
     prc = _sup.prec
-    P, lst = int(floor(log(abs(num), base))), []
+    P, lst = int(_sup.floor(_sup.log(abs(num), base))), []
     l, r, X = -base / (base + one), 1 / (base + one), num
     while not l <= X < r:  # P is better determined here
         P += 1             # the log taken above just speeds it up
         X = num / (-base) ** P
-    def T(x): return -base * x - floor(-base * x - l)
+    def T(x): return -base * x - _sup.floor(-base * x - l)
 
     if P <= 0:  # starting with a fractional value
         lst.extend([0, sep])
         #lst.extend(([0] * -int(P)))  # puts small values off a power
 
     # this appears to work for negative bases so I'm going with it
-    prc = int(prc * log(2, abs(base)))
+    prc = int(prc * _sup.log(2, abs(base)))
     prc = -1 if (P - prc) >= 0 else (P - prc)
 
     while P >= prc:  # conversion step
-        d = int(floor(-base * X - l))
+        d = int(_sup.floor(-base * X - l))
         X = T(X)
         if P == 0 and sep not in lst: lst.append(sep)  # add sep only once
         if d == base: lst.extend([d - 1, 0])  # if this happens, you do this
@@ -121,7 +178,7 @@ def to_vb(num, base, **kwargs):  # to inVerted base
 
     # for a base 0<b<1: convert to base 1/b,
     #  shift radix to the left one column and swap all the digits
-    inv = mpf(1) / mpf(base)  # invert the base, convert to base 1/B
+    inv = _sup.mpf(1) / _sup.mpf(base)  # invert the base, convert to base 1/B
     if int(num) == num and int(inv) == inv: ans = to_zb(num, inv, **kwargs)
     elif base < 0: ans = to_nb(num, inv, **kwargs)
     else: ans = to_pb(num, inv, **kwargs)
@@ -144,7 +201,7 @@ def to_rb(num, base, **kwargs):  # to Real base
     ties to_zb, to_pb, to_nb, to_vb into one function
     """
     E = ValueError('invalid base')
-    #num, base = mpf(num), mpf(base)
+    #num, base = _sup.mpf(num), _sup.mpf(base)
     if base < -1: ans = to_nb(num, base, **kwargs)
     elif 0 < abs(base) < 1: ans = to_vb(num, base, **kwargs)
     elif base > 1: ans = to_pb(num, base, **kwargs)
@@ -174,10 +231,10 @@ def to_ib(num, base, **kwargs):  # to Imaginary base
     eb = -(abs(base) ** 2)
     if abs(base.imag) > 1:
         real = to_nb(real, eb, **kwargs)
-        imag = to_nb(mpf(imag) / mpf(base.imag), eb, **kwargs)
+        imag = to_nb(_sup.mpf(imag) / _sup.mpf(base.imag), eb, **kwargs)
     elif 0 < abs(base.imag) < 1:
         real = to_vb(real, eb, **kwargs)
-        imag = to_vb(mpf(imag) / mpf(base.imag), eb, **kwargs)
+        imag = to_vb(_sup.mpf(imag) / _sup.mpf(base.imag), eb, **kwargs)
     else: raise E
 
     # split into whole and fractional parts
@@ -220,11 +277,11 @@ def to_10(num, base, **kwargs):
     else: return num
 
     if base.imag:  # imag/complex bases
-        s, ans, base = 1, mpc(0), mpc(base)
+        s, ans, base = 1, _sup.mpc(0), _sup.mpc(base)
     elif int(base) == base and sep not in num:  # integer bases
         s, ans, base = 1, 0, int(base)
     else:  # real bases
-        s, ans, base = 1, mpf(0), mpf(base)
+        s, ans, base = 1, _sup.mpf(0), _sup.mpf(base)
     if sgn in num: num.remove(sgn); s = -1  # handle negatives
 
     # determine order of magnitude
@@ -232,13 +289,13 @@ def to_10(num, base, **kwargs):
     except: P = len(num) - 1  # ints, longs
 
     # find max allowed character for base
-    if base.imag: chk = abs(base * mpc(base.real, -base.imag))  # can't use .conjugate(), gmpy2 2.0.8 crashes
+    if base.imag: chk = abs(base * _sup.mpc(base.real, -base.imag))  # can't use .conjugate(), gmpy2 2.0.8 crashes
     else: chk = abs(base)
 
     # error checking
     E = ValueError('invalid base')  # invalid bases 0 or 1
-    if 0 < chk < 1: chk = int(ceil(mpf(1) / chk))
-    elif chk > 1: chk = int(ceil(chk))
+    if 0 < chk < 1: chk = int(_sup.ceil(_sup.mpf(1) / chk))
+    elif chk > 1: chk = int(_sup.ceil(chk))
     else: raise E
     if max(num) >= chk:  # invalid characters
         mes = _sup.str_('invalid character for base {}').format(base)
@@ -3,52 +3,55 @@
 
 
 # imports -----------------------------------------------------------------
-from sys import maxunicode as maxchr
+from sys import maxunicode as maxchr, version_info
 from collections import namedtuple
+from bisect import bisect_right
 import warnings
-import string
 
-try:  # to look for better installed modules
-    #import this_is_not_a_module_name_this_is_just_for_testing
-    try:  # look for gmpy2
-        #import this_is_also_not_a_module_but_for_testing
-        import gmpy2 as gm
-        ceil, floor = gm.ceil, gm.floor
-        #mpf, mpc = gm.mpfr, gm.mpc
-        def log(x, b=None):
-            if not b: return gm.log(x)
-            else: return gm.log(x) / gm.log(b)
-
-        def mpf(x):
-            "converts input into multiprecision float - type gmpy2.mpfr"
-            return gm.mpfr(x)
-
-        def mpc(a, b=None):
-            "converts input into multiprecision complex - type gmpy2.mpc"
-            if not b: return gm.mpc(a)
-            else: return gm.mpc(a, b)
-        backend = 'gmpy2'
-
-    except ImportError:  # use mpmath instead
-        from mpmath import mp as mp
-        ceil, floor = mp.ceil, mp.floor
-        #mpf, mpc = mp.mpf, mp.mpc
-        log = mp.log
-
-        def mpf(x):
-            "converts input into multiprecision float - type mpmath.mp.mpf"
-            return mp.mpf(x)
-
-        def mpc(a, b=None):
-            "converts input into multiprecision complex - type mpmath.mp.mpc"
-            if not b: return mp.mpc(a)
-            else: return mp.mpc(a, b)
-        backend = 'mpmath'
-
-except ImportError:  # failing those, use the built-in modules
-    from math import ceil as _cil, floor as _flr
-    floor, ceil = lambda x: int(_flr(x)), lambda x: int(_cil(x))
+# backends ----------------------------------------------------------------
+# the multiprecision backend is picked on first use, not at import
+# mpf, mpc, log, ceil and floor below stand in until then - modules using
+# them should look them up as _sup.mpf (etc.) when called, not bind them
+def _use_gmpy2():
+    "look for gmpy2"
+    global gm
+    #import this_is_also_not_a_module_but_for_testing
+    import gmpy2 as gm
+    #mpf, mpc = gm.mpfr, gm.mpc
+    def log(x, b=None):
+        if not b: return gm.log(x)
+        else: return gm.log(x) / gm.log(b)
+
+    def mpf(x):
+        "converts input into multiprecision float - type gmpy2.mpfr"
+        return gm.mpfr(x)
+
+    def mpc(a, b=None):
+        "converts input into multiprecision complex - type gmpy2.mpc"
+        if not b: return gm.mpc(a)
+        else: return gm.mpc(a, b)
+    return 'gmpy2', mpf, mpc, log, gm.ceil, gm.floor
+
+def _use_mpmath():
+    "use mpmath instead"
+    global mp
+    from mpmath import mp as mp
+    #mpf, mpc = mp.mpf, mp.mpc
+
+    def mpf(x):
+        "converts input into multiprecision float - type mpmath.mp.mpf"
+        return mp.mpf(x)
 
+    def mpc(a, b=None):
+        "converts input into multiprecision complex - type mpmath.mp.mpc"
+        if not b: return mp.mpc(a)
+        else: return mp.mpc(a, b)
+    return 'mpmath', mpf, mpc, mp.log, mp.ceil, mp.floor
+
+def _use_decimal():
+    "failing those, use the built-in modules"
+    global dm, cd
+    from math import ceil as _cil, floor as _flr
     import decimal as dm
     try: import complex_decimal as cd
     except ImportError: from numsys import complex_decimal as cd
@@ -66,19 +69,63 @@ except ImportError:  # failing those, use the built-in modules
         "converts input into multiprecision complex - type ComplexDecimal"
         if not b: return cd.ComplexDecimal(a)
         else: return cd.ComplexDecimal(a, b)
-    backend = 'decimal'
+    return ('decimal', mpf, mpc, log,
+            lambda x: int(_cil(x)), lambda x: int(_flr(x)))
 
-##except ImportError:  # don't use the decimal module (not recommended)
+##def _use_floats():  # don't use the decimal module (not recommended)
 ##    from math import log, ceil, floor
-##    mpf, mpc = float, complex
-##    backend = None
+##    return None, float, complex, log, ceil, floor
 
-try: import nonstandard as nstd  # used in parse_base
-except ImportError: from numsys import nonstandard as nstd
+_backend = None  # name of the backend in use, None until one is loaded
 
-# functions ---------------------------------------------------------------
-warnings.simplefilter('always')  # warnings in this should be rare (hopefully!)
+def load_backend():
+    """picks the multiprecision backend (gmpy2, then mpmath, then decimal)
+    and applies the current precision to it - done once, on first use
+    returns the backend name"""
+    global _backend, backend, mpf, mpc, log, ceil, floor
+    if _backend: return _backend
+    #import this_is_not_a_module_name_this_is_just_for_testing
+    for use in (_use_gmpy2, _use_mpmath, _use_decimal):
+        try: found = use(); break
+        except ImportError: continue
+    name, mpf, mpc, log, ceil, floor = found
+    _backend = backend = name
+    set_prec(prec)
+    return name
+
+def mpf(x):
+    "converts input into multiprecision float (loads the backend)"
+    load_backend(); return mpf(x)
+
+def mpc(a, b=None):
+    "converts input into multiprecision complex (loads the backend)"
+    load_backend(); return mpc(a, b)
+
+def log(x, b=None):
+    "logarithm of x, natural or in base b (loads the backend)"
+    load_backend(); return log(x, b)
+
+def ceil(x):
+    "ceiling of x (loads the backend)"
+    load_backend(); return ceil(x)
+
+def floor(x):
+    "floor of x (loads the backend)"
+    load_backend(); return floor(x)
+
+_nstd = None
+
+def nonstandard():
+    """returns the nonstandard module, importing it (which registers
+    the named bases) on first use"""
+    global _nstd
+    if _nstd is None:
+        try: import nonstandard as nstd
+        except ImportError: from numsys import nonstandard as nstd
+        _nstd = nstd
+    return _nstd
 
+# functions ---------------------------------------------------------------
 # unicode/str for Python 2/3
 try:          str_ = unicode
 except NameError: str_ = str
@@ -107,17 +154,114 @@ def rround(n, d=5):
     ln = log(abs(n), 10) if n != 0 else 0
     return round(float(n), -int(floor(ln)) + d)
 
+class Digitset(object):
+    """ordered set of digit characters, stored as runs of code points
+    behaves like the list it replaces: digitset[value] gives the character,
+    digitset.index(char) gives the value - both without a linear scan
+
+    chars - explicit characters, in order (duplicates are skipped)
+    ranges - (start, stop) code point ranges appended after chars,
+             skipping any character that has already been seen
+    """
+    __slots__ = ('_head', '_hidx', '_vals', '_cps', '_lens',
+                 '_cpsort', '_cprun', '_size', '_cache')
+    _head_size = 256  # digits kept in a plain string/dict for speed
+
+    def __init__(self, chars=(), ranges=()):
+        runs = []  # [first code point, length], in value order
+        for c in unique(chars):
+            cp = ord(c)
+            if runs and runs[-1][0] + runs[-1][1] == cp: runs[-1][1] += 1
+            else: runs.append([cp, 1])
+
+        for lo, hi in ranges:  # fill in the gaps between seen code points
+            taken = sorted((cp, cp + n) for cp, n in runs)
+            for a, b in taken + [(hi, hi)]:
+                if lo >= hi: break
+                if b <= lo: continue
+                if a > lo:
+                    gap = min(a, hi)
+                    if runs and runs[-1][0] + runs[-1][1] == lo:
+                        runs[-1][1] += gap - lo
+                    else: runs.append([lo, gap - lo])
+                lo = max(lo, b)
+
+        self._cps = [cp for cp, n in runs]
+        self._lens = [n for cp, n in runs]
+        self._vals, v = [], 0
+        for n in self._lens: self._vals.append(v); v += n
+        self._size = v
+
+        order = sorted(range(len(runs)), key=self._cps.__getitem__)
+        self._cpsort = [self._cps[r] for r in order]
+        self._cprun = order
+
+        head = str_().join(map(self._get, range(min(v, self._head_size))))
+        self._head = head
+        self._hidx = dict((c, i) for i, c in enumerate(head))
+        self._cache = {}  # per digitset lookup tables, see other functions
+
+    def _get(self, i):
+        r = bisect_right(self._vals, i) - 1
+        return chr_(self._cps[r] + i - self._vals[r])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._size))]
+        if 0 <= i < len(self._head): return self._head[i]
+        if i < 0: i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('digitset index out of range')
+        return self._get(i)
+
+    def index(self, char):
+        "returns the value of char"
+        val = self._hidx.get(char)
+        if val is not None: return val
+        try: cp = ord(char)
+        except TypeError: cp = -1
+        j = bisect_right(self._cpsort, cp) - 1
+        if j >= 0:
+            r = self._cprun[j]; off = cp - self._cps[r]
+            if off < self._lens[r]: return self._vals[r] + off
+        raise ValueError('{!r} is not in digitset'.format(char))
+
+    def join(self, values):
+        "maps a sequence of digit values to characters, returns a string"
+        if values and min(values) >= 0:
+            try: return str_().join(map(self._head.__getitem__, values))
+            except IndexError: pass
+        return str_().join(map(self.__getitem__, values))
+
+    def __contains__(self, char):
+        try: self.index(char); return True
+        except ValueError: return False
+
+    def __iter__(self):
+        for cp, n in zip(self._cps, self._lens):
+            for c in range(cp, cp + n): yield chr_(c)
+
+    def __len__(self): return self._size
+
+    def __repr__(self):
+        return '{}({!r}, {} runs, {:,} digits)'.format(
+            type(self).__name__, self._head[:16], len(self._cps), self._size)
+
 def default_digitset(full=True):
-    "returns the default digitset as a list"
-    digits = list(string.printable.swapcase())
-    if full: digits += list(map(chr_, range(maxchr)))
-    return unique(digits)
+    "returns the default digitset"
+    ranges = [(0, maxchr)] if full else []
+    return Digitset(printable, ranges)
+
+def get_digitset():
+    "returns the digitset in use, building the default one on first use"
+    try: return digitset
+    except NameError: set_digitset(default_digitset()); return digitset
 
 def set_digitset(seq):
     "sets digitset to given digits in seq"
     global digitset, zero_types
-    digitset = unique(seq)  # be a tuple? but tuple has slower access time
-    zero_types = [0, [], [0], digitset[0], str_(), '']  # than a list - curious
+    digitset = seq if isinstance(seq, Digitset) else Digitset(seq)
+    zero_types = [0, [], [0], digitset[0], str_(), '']
 
 def set_prec(prc=None):
     """
@@ -136,13 +280,13 @@ def set_prec(prc=None):
     if prc is None: return prec
     prc = int(abs(prc))
 
-    if backend == 'mpmath':  # base ten precision
+    if _backend == 'mpmath':  # base ten precision
         mp.prec = int(prc * log(2, 10))
-    elif backend == 'gmpy2':  # base two precision
+    elif _backend == 'gmpy2':  # base two precision
         gm.set_context(gm.context(precision = prc))
-    elif  backend == 'decimal':  # base ten precision
+    elif _backend == 'decimal':  # base ten precision
         dm.getcontext().prec = int(prc * log(2, 10))
-    else: pass
+    else: pass  # not loaded yet - load_backend applies prec when it is
 
     prec = prc
     return prc
@@ -150,7 +294,7 @@ def set_prec(prc=None):
 def clean(num, sgn='-', sep='.'):
     """removes leading and trailing zeros from a list
     pass False to sgn and sep if known to NOT to be in num"""
-    global digitset
+    digitset = get_digitset()
 
     # handle negative sign
     if sgn and sgn in num:
@@ -199,12 +343,12 @@ def str_to_lst(s, sgn='-', sep='.'):
         raise E
 
     # convert to list of base ten digits
-    lst = []
+    lst, index = [], get_digitset().index
     for char in s:
         if char == sgn: val = sgn  # minus sign
         elif char == sep: val = sep  # radix
         else:
-            try: val = digitset.index(char)  # digit value
+            try: val = index(char)  # digit value
             except ValueError:  # char not in digitset
                 E = ValueError('unknown character/character not in digitset')
                 raise E
@@ -229,10 +373,9 @@ def lst_to_str(lst, sgn='-', sep='.'):
         has_sep = False
 
     try:  # map values in list to corresponding characters
-        digit_get = digitset.__getitem__
-        num_str = ((sgn if has_sgn else emp) +
-                   emp.join(map(digit_get, whl)) +
-                   (sep + emp.join(map(digit_get, frc)) if frc else emp))
+        digit_join = get_digitset().join
+        num_str = ((sgn if has_sgn else emp) + digit_join(whl) +
+                   (sep + digit_join(frc) if frc else emp))
     except IndexError:  # value larger than available digits, put as list
         num_str = ([sgn] if has_sgn else []) + lst
 
@@ -269,7 +412,7 @@ def parse_base(b):
     name = type(b).__name__
     if name in str_types:
         b = str_(b).lower()
-        if b in nstd.nstd_bases: pass
+        if b in nonstandard().nstd_bases: pass
         elif 'i' in b or 'j' in b: b = mpc(b.replace('i', 'j'))
         else:
             try: b = int(b)
@@ -303,8 +446,21 @@ references = {'A': {'ref': u'A. Rényi, "Representations for real numbers '
 # constants ---------------------------------------------------------------
 version = '1.0.01'
 maxchr += 1  # base 0 uses no characters, so all of unicode is valid
-prec = set_prec(100)   # precision (in base two)
-digitset = default_digitset()
-zero_types = [0, [], [0], digitset[0], str_(), '']  # this is reset with set_digitset
+prec = 100  # precision (in base two), applied to the backend when it loads
 str_types = ('str', 'unicode')
+printable = ('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+             '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ \t\n\r\x0b\x0c')
+# string.printable.swapcase() - written out to skip importing string (and re)
+
+# digitset, zero_types (reset with set_digitset) and backend are set up on
+# first use; until then, module attribute access falls through to here
+def __getattr__(name):
+    if name in ('digitset', 'zero_types'):
+        get_digitset(); return globals()[name]
+    elif name == 'backend': return load_backend()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(
+        __name__, name))
+
+if version_info < (3, 7):  # no module __getattr__, so set up now
+    load_backend(); get_digitset()
 
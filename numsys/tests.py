@@ -29,6 +29,27 @@ class testNumsys(unittest.TestCase):
                 self.assertEqual(i, j, msg=mesg.format(b, i, j))
 
 
+    def test_large_int_split(self):
+        "divide and conquer integer conversion against digit by digit"
+        mesg = 'split conversion to base {} differs with a {} bit input'
+
+        ints = [random.randint(-2 ** 20000, 2 ** 20000) for i in range(5)]
+        ints += [2 ** 9000, -2 ** 9000, 10 ** 3000, -(10 ** 3000) + 1]
+        bases = [2, 3, 10, -2, -3, -10, 1000, -1000, _sup.maxchr - 1]
+
+        dc_bits = _std._dc_bits
+        try:
+            for b in bases:
+                for i in ints:
+                    _std._dc_bits = dc_bits
+                    split = _std.to_zb(i, b)
+                    _std._dc_bits = abs(i).bit_length()  # digit by digit
+                    whole = _std.to_zb(i, b)  # (no list diff if unequal)
+                    self.assertTrue(split == whole,
+                                    msg=mesg.format(b, i.bit_length()))
+        finally: _std._dc_bits = dc_bits
+
+
     def test_real_int_identity(self):
         "integer base conversion with reals from base 10 to base B to 10"
         mesg = ('base 10 to base {} to base 10 conversion failed'
@@ -122,6 +143,27 @@ class testNumsys(unittest.TestCase):
                 self.assertEqual(rnd_i, rnd_j, msg=mesg.format(b, i, j))
 
 
+    def test_digitset_lookup(self):
+        "digitset value to character to value lookups"
+        mesg = 'digitset lookup failed with value {} (character {!r})'
+        ds = _sup.digitset
+        vals = list(range(300)) + [len(ds) - 1]
+        vals += random.sample(range(len(ds)), 1000)
+
+        for v in vals:
+            c = ds[v]
+            self.assertEqual(v, ds.index(c), msg=mesg.format(v, c))
+        self.assertEqual(len(ds), _sup.maxchr)
+        self.assertRaises(IndexError, ds.__getitem__, len(ds))
+
+        _sup.set_digitset('abcabcXYZ0')  # duplicates are skipped
+        try:
+            self.assertEqual(list(_sup.digitset), list('abcXYZ0'))
+            self.assertEqual(_sup.str_to_lst('-cZ.a'), ['-', 2, 5, '.', 0])
+            self.assertEqual(_sup.lst_to_str([2, 5, '.', 1]), 'cZ.b')
+        finally: _sup.set_digitset(ds)
+
+
     def test_nstd_int_identity(self):
         "base conversion of nonstandard bases"
         mesg = ('10 to {} to 10 conversion failed'